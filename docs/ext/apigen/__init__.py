@@ -1,11 +1,11 @@
 # pylint: disable=protected-access
 """Sphinx extension to generate API documentation."""
+import collections
 import copy
 import importlib
 import inspect
 import os
 import pkgutil
-import shutil
 import types
 
 import jinja2.sandbox
@@ -19,13 +19,25 @@ TEMPLATE_FILE = os.path.join(
 )
 
 CONFIG_NAME = __name__ + "_config"
-DEFAULT_CONFIG = {"runtime": {"app": None}}
+DEFAULT_CONFIG = {"runtime": {"app": None, "modules": {}}}
+IMPORTED_MODULES = {}
+
+# Container in which the members are registered, indexed by their exact type.
+# The members with a type that is not listed fall back to slower checks.
+MODULE_MEMBERS = {
+    types.ModuleType: None,
+    types.FunctionType: "functions",
+    types.BuiltinFunctionType: "functions",
+    type: "classes",
+}
 
 
 def import_module(module, app):
     """Handle the import of a module by mocking them with autodoc config.
 
     Query the value of ``autodoc_mock_imports`` inside the ``conf.py`` module.
+    The imported modules are cached to avoid setting up the mock finder again
+    when the same module is requested several times.
 
     Arguments:
         module (str): The name of the module to import.
@@ -34,8 +46,63 @@ def import_module(module, app):
     Returns:
         module: The python module.
     """
+    if module not in IMPORTED_MODULES:
+        with sphinx.ext.autodoc.mock(app.config.autodoc_mock_imports or []):
+            IMPORTED_MODULES[module] = importlib.import_module(module)
+    return IMPORTED_MODULES[module]
+
+
+def write_file(path, content):
+    """Write the content to a file only if it differs from the existing one.
+
+    Leaving the unchanged files untouched preserves their modification time,
+    so sphinx can keep the cached environment for them.
+
+    Arguments:
+        path (str): The path of the file to write.
+        content (str): The content of the file.
+
+    Returns:
+        bool: True if the file has been written.
+    """
+    data = content.encode("utf-8")
+    if os.path.exists(path):
+        with open(path, "rb") as stream:
+            if stream.read() == data:
+                return False
+
+    # Write the raw bytes directly to skip the text wrapper layers. The data
+    # goes to a temporary file first and is then moved to its final location,
+    # so a sphinx worker can never read a partially written file.
+    temp = path + ".tmp"
+    descriptor = os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(descriptor, data)
+    finally:
+        os.close(descriptor)
+    os.replace(temp, path)
+    return True
+
+
+def index_modules(package, app):
+    """Find all the submodules of a package, grouped by their parent.
+
+    The whole package is walked only once instead of scanning the directory
+    of each sub-package separately.
+
+    Arguments:
+        package (module): The root package.
+        app (Sphinx): The current sphinx application.
+
+    Returns:
+        dict: The modules info indexed by the name of their parent package.
+    """
+    index = collections.defaultdict(list)
+    prefix = package.__name__ + "."
     with sphinx.ext.autodoc.mock(app.config.autodoc_mock_imports or []):
-        return importlib.import_module(module)
+        for info in pkgutil.walk_packages(package.__path__, prefix):
+            index[info[1].rpartition(".")[0]].append(info)
+    return index
 
 
 class Node(object):
@@ -47,6 +114,16 @@ class Node(object):
         config (dict): The configuration dictionary.
     """
 
+    __slots__ = (
+        "_config",
+        "_kwargs",
+        "_prefix",
+        "name",
+        "path",
+        "parent",
+        "members",
+        "is_empty",
+    )
     type = ""
     directive = ""
 
@@ -54,7 +131,7 @@ class Node(object):
         return "<Node::{} '{}'>".format(self.type, self.name)
 
     def __init__(self, name, parent, config):
-        prefix = (parent.path + ".") if parent is not None else ""
+        prefix = parent._prefix if parent is not None else ""
 
         self._config = config
         self._kwargs = {"name": name, "parent": self, "config": config}
@@ -62,21 +139,25 @@ class Node(object):
         self.name = name
         self.path = prefix + self.name
 
+        # Prefix of the children paths, computed once for all of them.
+        self._prefix = self.path + "."
+
         self.parent = parent
         self.members = []
 
+        # Plain attribute instead of a property as it is queried a lot while
+        # rendering the templates. Kept up to date when children are added.
+        self.is_empty = True
+
         if parent is not None:
             parent.members.append(self)
-
-    @property
-    def is_empty(self):
-        """bool: Does the node have any children?"""
-        return bool(self.members)
+            parent.is_empty = False
 
 
 class Variable(Node):
     """Variable node object."""
 
+    __slots__ = ()
     type = "variable"
     directive = "autodata"
 
@@ -84,6 +165,7 @@ class Variable(Node):
 class Function(Variable):
     """Function node object."""
 
+    __slots__ = ()
     type = "function"
     directive = "autofunction"
 
@@ -91,6 +173,7 @@ class Function(Variable):
 class Class(Variable):
     """Class node object."""
 
+    __slots__ = ("attributes", "properties", "methods")
     type = "class"
     directive = "autoclass"
 
@@ -101,44 +184,14 @@ class Class(Variable):
         self.properties = []
         self.methods = []
 
-        # cls = getattr(self.parent._module, self.name)
-        # self._obj = cls
-
-        # # Register children.
-        # for name, obj in cls.__dict__.items():
-        #     if name.startswith("_"):
-        #         continue
-
-        #     if isinstance(obj, property):
-        #         self.properties.append(Property(**self._kwargs))
-
-        #     elif isinstance(obj, types.MethodType):
-        #         self.methods.append(Method(**self._kwargs))
-
-        # obj = getattr(cls, name)
-
-        # qualname = getattr(obj, "__qualname__", None)
-        # if qualname and self.name not in qualname:
-        #     continue
-        # print(qualname, name, obj)
-
-        # print(name)
-
-        # children = [
-        #     {"predicate": inspect.ismethod, "container": self.methods},
-        #     {"predicate": inspect.is, "container": self.methods},
-        # ]
-
-        # for name, _ in inspect.getmembers(cls, predicate=inspect.ismethod):
-        #     if name.startswith("_"):
-        #         continue
-        #     node = Method(name, parent=self, config=self._config)
-        #     self.methods.append(node)
+        # The members of the classes are not rendered by the template, so they
+        # are not registered.
 
 
 class Attribute(Variable):
     """Attribute node object."""
 
+    __slots__ = ()
     type = "attribute"
     directive = "autoattribute"
 
@@ -146,6 +199,7 @@ class Attribute(Variable):
 class Method(Function):
     """Method node object."""
 
+    __slots__ = ()
     type = "method"
     directive = "automethod"
 
@@ -153,6 +207,7 @@ class Method(Function):
 class Property(Method):
     """Property node object."""
 
+    __slots__ = ()
     type = "property"
     directive = "autoproperty"
 
@@ -161,13 +216,15 @@ class Exception_(Class):
     # pylint: disable=invalid-name
     """Exception node object."""
 
+    __slots__ = ()
     type = "exception"
-    direction = "autoexception"
+    directive = "autoexception"
 
 
 class Module(Node):
     """Package node object."""
 
+    __slots__ = ("_module", "constants", "functions", "classes")
     type = "module"
     directive = "automodule"
 
@@ -188,26 +245,36 @@ class Module(Node):
         self.classes = []
 
         # Register children.
+        nodes = {
+            "constants": Variable,
+            "functions": Function,
+            "classes": Class,
+        }
         for name in getattr(module, "__all__", dir(module)):
             if name.startswith("_"):
                 continue
 
             # Get the python object.
             obj = getattr(module, name)
-            kwargs = self._kwargs.copy()
-            kwargs["name"] = name
+            type_ = type(obj)
+
+            if type_ in MODULE_MEMBERS:
+                container = MODULE_MEMBERS[type_]
+            elif isinstance(obj, types.ModuleType) or hasattr(obj, "__path__"):
+                container = None
+            elif isinstance(obj, types.FunctionType):
+                container = "functions"
+            elif inspect.isclass(obj):
+                container = "classes"
+            else:
+                container = "constants"
 
-            if isinstance(obj, types.ModuleType) or hasattr(obj, "__path__"):
+            if container is None:
                 continue
 
-            if isinstance(obj, types.FunctionType):
-                self.functions.append(Function(**kwargs))
-
-            elif inspect.isclass(obj):
-                self.classes.append(Class(**kwargs))
-
-            else:
-                self.constants.append(Variable(**kwargs))
+            kwargs = self._kwargs.copy()
+            kwargs["name"] = name
+            getattr(self, container).append(nodes[container](**kwargs))
 
     def _generate(self, template, output, **kwargs):
         """Generate the rst files.
@@ -216,14 +283,19 @@ class Module(Node):
             template (Template): The jinja template to use to generate the doc.
             output (str): The output directory.
             **kwargs: The available keyword inside the jinja template.
+
+        Returns:
+            list: The paths of the generated files.
         """
-        with open(os.path.join(output, self.path + ".rst"), "w") as stream:
-            stream.write(template.render(node=self, **kwargs))
+        path = os.path.join(output, self.path + ".rst")
+        write_file(path, template.render(node=self, **kwargs))
+        return [path]
 
 
 class Package(Module):
     """Module node object."""
 
+    __slots__ = ("packages", "modules")
     type = "package"
 
     def __init__(self, *args, **kwargs):
@@ -233,7 +305,7 @@ class Package(Module):
         self.modules = []
 
         # Populate the children packages and modules.
-        modules = pkgutil.iter_modules(self._module.__path__, self.path + ".")
+        modules = self._config["runtime"]["modules"].get(self.path, [])
         for _, name, is_package in modules:
             name = name.split(".")[-1]
             if is_package:
@@ -244,9 +316,18 @@ class Package(Module):
                 self.modules.append(node)
 
     def _generate(self, template, output, **kwargs):
-        super(Package, self)._generate(template, output)
-        for node in self.modules + self.packages:
-            node._generate(template, output, **kwargs)
+        # Each module is rendered into its own file without touching the
+        # state of its siblings, which keeps the generation safe when sphinx
+        # runs in parallel mode (``-j auto``). The tree is traversed with a
+        # queue rather than recursively.
+        paths = []
+        queue = collections.deque([self])
+        while queue:
+            node = queue.popleft()
+            paths.extend(Module._generate(node, template, output, **kwargs))
+            if isinstance(node, Package):
+                queue.extend(node.modules + node.packages)
+        return paths
 
 
 def builder_inited(app):
@@ -255,39 +336,49 @@ def builder_inited(app):
     Arguments:
         app (Sphinx): The current sphinx application.
     """
-    # Prepare the output directory.
+    # Prepare the output directory. The previous files are kept to allow
+    # sphinx to only read again the pages that have changed.
     default = os.path.join(app.srcdir, __name__)
-    if os.path.exists(default):
-        shutil.rmtree(default)
-    os.makedirs(default)
+    if not os.path.exists(default):
+        os.makedirs(default)
 
     # Ensure that the files will not be pushed with git.
-    with open(os.path.join(default, ".gitignore"), "w") as stream:
-        stream.write("*")
+    write_file(os.path.join(default, ".gitignore"), "*")
+
+    # Initialize jinja template once, it is shared by the whole node tree.
+    loader = sphinx.jinja2glue.BuiltinTemplateLoader()
+    loader.init(app.builder, dirs=[os.path.dirname(TEMPLATE_FILE)])
+    env = jinja2.sandbox.SandboxedEnvironment(loader=loader)
+    template = env.get_template(TEMPLATE_FILE)
 
+    generated = set()
     for name, config in getattr(app.config, CONFIG_NAME).items():
-        module = importlib.import_module(name)
+        module = import_module(name, app)
         is_package = hasattr(module, "__path__")
 
         # Find the output directory.
         output = default
         if is_package:
             output = os.path.join(default, name)
-            os.makedirs(output)
-
-        # Initialize jinja template.
-        loader = sphinx.jinja2glue.BuiltinTemplateLoader()
-        loader.init(app.builder, dirs=[os.path.dirname(TEMPLATE_FILE)])
-        env = jinja2.sandbox.SandboxedEnvironment(loader=loader)
-        template = env.get_template(TEMPLATE_FILE)
+            if not os.path.exists(output):
+                os.makedirs(output)
 
         # Build final configuration.
         config = copy.deepcopy(DEFAULT_CONFIG)
         config.update(config or {})
         config["runtime"]["app"] = app
+        if is_package:
+            config["runtime"]["modules"] = index_modules(module, app)
 
         node = (Package if is_package else Module)(name, config=config)
-        node._generate(template, output)
+        generated.update(node._generate(template, output))
+
+    # Remove the files of the modules that no longer exist.
+    for root, _, files in os.walk(default):
+        for file_ in files:
+            path = os.path.join(root, file_)
+            if file_.endswith(".rst") and path not in generated:
+                os.remove(path)
 
 
 def setup(app):
@@ -295,4 +386,9 @@ def setup(app):
     app.setup_extension("sphinx.ext.autodoc")
     app.add_config_value(CONFIG_NAME, {}, "env", dict)
     app.connect("builder-inited", builder_inited)
-    return {"version": __version__}
+    return {
+        "version": __version__,
+        "parallel_read_safe": True,
+        "parallel_write_safe": True,
+        "env_version": 1,
+    }
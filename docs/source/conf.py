@@ -4,9 +4,13 @@
 This file does only contain a selection of the most common options. For a
 full list see the documentation:
 https://www.sphinx-doc.org/en/master/usage/configuration.html
+
+All the extensions used are parallel safe, so the build can be distributed
+over all the available cores using ``sphinx-build -j auto``.
 """
-import importlib
+import ast
 import os
+import re
 import sys
 
 # Path setup.
@@ -14,24 +18,41 @@ root_path = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 docs_path = os.path.join(root_path, "docs")
 src_path = os.path.join(root_path, "src")
 ext_path = os.path.join(docs_path, "ext")
-sys.path.append(src_path)
-sys.path.append(ext_path)
+for path in (ext_path, src_path):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+def read_version(path):
+    """Read the ``__version__`` of a module without importing it.
+
+    Arguments:
+        path (str): The path to the python file to read.
+
+    Returns:
+        str: The version of the module.
+    """
+    with open(path, "r") as stream:
+        tree = ast.parse(stream.read(), filename=path)
+    for node in tree.body:
+        if not isinstance(node, ast.Assign):
+            continue
+        if any(getattr(x, "id", None) == "__version__" for x in node.targets):
+            return ast.literal_eval(node.value)
+    return ""
 
-# Import package.
-ftd = importlib.import_module("ftd")
 
 # Project information.
 project = "ftd"
 author = "Fabien Taxil"
 project_copyright = "2021, " + author
-version = ftd.__version__
+version = read_version(os.path.join(src_path, "ftd", "__init__.py"))
 
 # General configuration.
 extensions = [
     "sphinx.ext.todo",
     "sphinx.ext.autodoc",
     "sphinx.ext.napoleon",
-    "sphinx.ext.viewcode",
     "sphinx.ext.intersphinx",
     "sphinx.ext.autosummary",
     "sphinx.ext.inheritance_diagram",
@@ -56,7 +77,9 @@ html_theme = "furo"
 html_title = "ftd"
 html_short_title = "ftd"
 html_static_path = ["_static"]
-html_show_sourcelink = True
+html_show_sourcelink = False
+html_copy_source = False
+html_use_index = False
 htmlhelp_basename = "ftddoc"
 
 # Extension configuration.
@@ -67,28 +90,31 @@ autodoc_mock_imports = ["maya"]
 autodoc_default_options = {"show-inheritance": True}
 apigen_config = {"ftd": None}
 
+# Docstring processing. Each line matching one of the keys is replaced by the
+# associated value:
+# - The schema are replaced by a code block directive.
+# - The example admonitions are replaced with sphinx-panel dropdowns (examples
+#   must be converted to admonitions first using the setting:
+#   `napoleon_use_admonition_for_examples=True`)
+DOCSTRING_REPLACEMENTS = {
+    "Schema:": ".. code-block::\n",
+    ".. admonition:: Examples": ".. dropdown:: Examples",
+}
+DOCSTRING_REGEX = re.compile(
+    "^(?:{})$".format("|".join(map(re.escape, DOCSTRING_REPLACEMENTS))),
+    re.MULTILINE,
+)
+
 
 def process_docstring(app, what, name, obj, options, lines):
     """Customize the way that sphinx parse the docstrings."""
-    old_lines = list(lines)
-    lines[:] = []
-    for line in old_lines:
-
-        # Replace the schema by a code block directive.
-        if line == "Schema:":
-            line = [".. code-block::", ""]
-
-        # Replace all example admonitions with sphinx-panel dropdowns (examples
-        # must be converted to admonitions first using the setting:
-        # `napoleon_use_admonition_for_examples=True`)
-        elif line == ".. admonition:: Examples":
-            line = line.replace("admonition", "dropdown")
-
-        # Add the new line(s).
-        if isinstance(line, list):
-            lines.extend(line)
-        else:
-            lines.append(line)
+    if not lines:
+        return
+    text = DOCSTRING_REGEX.sub(
+        lambda match: DOCSTRING_REPLACEMENTS[match.group(0)],
+        "\n".join(lines),
+    )
+    lines[:] = text.split("\n")
 
 
 def setup(app):
@@ -0,0 +1,76 @@
+# pylint: disable=import-outside-toplevel
+"""Measure the encoding of the node names with and without the name cache."""
+import os
+import subprocess
+import sys
+import timeit
+
+import run_tests
+
+# The names encoded at each iteration, and the number of iterations.
+NAMES = ["|node{0}|child{0}".format(x) for x in range(100)]
+NUMBER = 100
+
+
+def main():
+    """CLI entry point.
+
+    The benchmark runs in the mayapy of the given version of maya, or in the
+    most recent one by default.
+    """
+    versions = [x for x in sys.argv[1:] if x.isdigit()] or [None]
+    executable = run_tests.find_mayapy(versions[0])
+    if executable is None:
+        print("Unable to find mayapy for maya {}.".format(versions[0]))
+        return 1
+
+    command = (
+        "import sys;"
+        "sys.path.append('{}');"
+        "import benchmark_encode;"
+        "benchmark_encode.run();"
+    ).format(os.path.dirname(os.path.abspath(__file__)))
+    return subprocess.call([executable, "-c", command])
+
+
+def run():
+    """Entry point, print the time spent to encode :data:`NAMES`."""
+    from maya import cmds, standalone
+
+    standalone.initialize()
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.append(os.path.join(root, "src"))
+
+    from ftd.api import maya
+
+    for index in range(len(NAMES)):
+        parent = cmds.createNode("transform", name="node{}".format(index))
+        name = "child{}".format(index)
+        cmds.createNode("transform", name=name, parent=parent)
+
+    def encode():
+        for name in NAMES:
+            maya.encode(name)
+
+    size = maya._NAME_CACHE_SIZE  # pylint: disable=protected-access
+    for label, cache_size in (("cached", size), ("uncached", 0)):
+        maya._NAME_CACHE_SIZE = cache_size  # pylint: disable=protected-access
+        maya.clear()
+        # The instances are held weakly, keep the nodes alive as a tool
+        # would do, otherwise the cached names are never found.
+        nodes = [maya.encode(x) for x in NAMES]
+        seconds = min(timeit.repeat(encode, number=NUMBER, repeat=5))
+        print(
+            "{:<10} {:.2f} us per name".format(
+                label, seconds / (NUMBER * len(NAMES)) * 1e6
+            )
+        )
+        del nodes
+    maya._NAME_CACHE_SIZE = size  # pylint: disable=protected-access
+
+    standalone.uninitialize()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,7 +10,14 @@ def main():
 
     os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-    argv = ["docs/source", "docs/build", "-E"]
+    # Use a doctree directory per builder to avoid invalidating the cached
+    # environment when switching between builders.
+    builder = "html"
+    if "-b" in sys.argv[1:-1]:
+        builder = sys.argv[sys.argv.index("-b") + 1]
+    doctree = "docs/build/doctrees-{}".format(builder)
+
+    argv = ["docs/source", "docs/build", "-j", "auto", "-d", doctree]
     argv.extend(sys.argv[1:])
     status = sphinx.cmd.build.main(argv)
 
@@ -2,10 +2,45 @@
 import argparse
 import logging
 import os
+import re
 import sys
 
 LOG = logging.getLogger(__name__)
 ROOT = os.path.dirname(os.path.abspath(__file__))
+MODULE_PATH_REGEX = re.compile(r"^.*MAYA_MODULE_PATH.*$", re.MULTILINE)
+
+# The default location of the maya application directory for each platform.
+APP_DIRS = {
+    "win32": ("~", "Documents", "maya"),
+    "darwin": ("~", "Library", "Preferences", "Autodesk", "maya"),
+    "linux": ("~", "maya"),
+}
+_APP_DIR_CACHE = {}
+
+UNSUPPORTED_PLATFORM_MESSAGE = (
+    "Sorry, the plateform '%s' is not keep in charge for this installation. "
+    "Please do a manual install and/or let me know the problem so I can take "
+    "care of your case."
+)
+MISSING_VERSION_MESSAGE = (
+    "The specified version of maya is not installed on the system."
+)
+
+
+def default_app_dir():
+    """Find the default maya application directory of the current platform.
+
+    Returns:
+        str: The path to the directory or None if the platform is unknown.
+    """
+    # Python 2 reports linux as "linux2".
+    platform = "linux" if sys.platform.startswith("linux") else sys.platform
+    if platform not in _APP_DIR_CACHE:
+        path = APP_DIRS.get(platform)
+        if path is not None:
+            path = os.path.expanduser(os.path.join(*path))
+        _APP_DIR_CACHE[platform] = path
+    return _APP_DIR_CACHE[platform]
 
 
 def main(version=None):
@@ -31,27 +66,17 @@ def main(version=None):
     # Otherwise, let's find the application directory depending on the user's
     # operating system.
     if app_dir is None:
-        if sys.platform == "win32":
-            path = ("~", "Documents", "maya")
-        elif sys.platform == "darwin":
-            path = ("~", "Library", "Preferences", "Autodesk", "maya")
-        elif sys.platform == "linux":
-            path = ("~", "maya")
-        else:
-            msg = "Sorry, the plateform '%s' is not keep in charge for this"
-            msg += "installation. Please do a manual install and/or let me"
-            msg += " know the problem so I can take care of your case."
-            LOG.error(msg, sys.platform)
-
-        app_dir = os.path.expanduser(os.path.join(*path))
+        app_dir = default_app_dir()
+        if app_dir is None:
+            LOG.error(UNSUPPORTED_PLATFORM_MESSAGE, sys.platform)
+            return
         assert os.path.exists(app_dir)
 
     # add the version of maya if the user has provided one
     if version is not None:
         app_dir = os.path.join(app_dir, str(version))
     if not os.path.exists(app_dir):
-        msg = "The specified version of maya is not installed on the system."
-        LOG.error(msg)
+        LOG.error(MISSING_VERSION_MESSAGE)
         return
 
     # - Add the package to the MAYA_MODULE_PATH environement variable ---
@@ -61,26 +86,30 @@ def main(version=None):
     env_file = os.path.join(app_dir, "Maya.env")
 
     # get existing variables
-    lines = []
+    content = ""
     if os.path.exists(env_file):
         with open(env_file, "r") as stream:
-            lines = stream.readlines()
+            content = stream.read()
+    match = MODULE_PATH_REGEX.search(content)
 
     # add the package to the variable
-    for index, line in enumerate(lines):
-        if "MAYA_MODULE_PATH" in line:
-            if ROOT not in line:
-                line = line.strip()
-                sep = "" if line.endswith(";") else ";"
-                lines[index] = "{}{}{}\n".format(line, sep, ROOT)
-            break
+    if match is None:
+        # Only append the variable at the end of the file.
+        with open(env_file, "a") as stream:
+            if content and not content.endswith("\n"):
+                stream.write("\n")
+            stream.write("MAYA_MODULE_PATH={}\n".format(ROOT))
+        LOG.info("Module add to the file '%s'", env_file)
+    elif ROOT in match.group(0):
+        LOG.info("Module already present in the file '%s'", env_file)
     else:
-        lines.append("MAYA_MODULE_PATH={}\n".format(ROOT))
-
-    # edit the Maya.env file
-    with open(env_file, "w") as stream:
-        stream.writelines(lines)
-    LOG.info("Module add to the file '%s'", env_file)
+        line = match.group(0).strip()
+        sep = "" if line.endswith(";") else ";"
+        line = "{}{}{}".format(line, sep, ROOT)
+        content = content[: match.start()] + line + content[match.end() :]
+        with open(env_file, "w") as stream:
+            stream.write(content)
+        LOG.info("Module add to the file '%s'", env_file)
 
     LOG.info("Installation completed!")
 
@@ -5,32 +5,120 @@ import re
 import subprocess
 import sys
 
+_MAYA_DIRECTORY_REGEX = re.compile(r"[Mm]aya([0-9]{4})(?:-x64)?")
+_MAYAPY_CACHE = {}
+
+# The arguments passed to pytest for each of the available suites.
+SUITES = {
+    "unit": ["src", "tests"],
+    "doctest": ["src", "--doctest-modules"],
+}
+
 
 def main():
-    """CLI entry point."""
+    """CLI entry point.
+
+    Each requested version of maya runs the test suites in its own mayapy
+    process. The processes are launched at the same time, unless a maximum
+    number of concurrent processes is specified with ``--jobs N``.
+
+    The suites to run can be selected with ``--suite NAME`` (see
+    :data:`SUITES`), all of them are run in the same maya session.
+    """
     # Parse the arguments in `sys.argv`.
-    versions = [str(x) for x in sys.argv[1:] if x.isdigit()]
-    argv = []
+    args = sys.argv[1:]
+    jobs = None
+    suites = []
+    while "--jobs" in args[:-1]:
+        index = args.index("--jobs")
+        jobs = int(args.pop(index + 1))
+        del args[index]
+    while "--suite" in args[:-1]:
+        index = args.index("--suite")
+        suites.append(args.pop(index + 1))
+        del args[index]
+    for suite in suites:
+        if suite not in SUITES:
+            print(
+                "Unknown suite '{}', choose from: {}.".format(
+                    suite, ", ".join(sorted(SUITES))
+                )
+            )
+            return 1
+    versions = [str(x) for x in args if x.isdigit()] or [None]
+    jobs = max(jobs or len(versions), 1)
 
     command = (
         "import sys;"
         "sys.path.append('{}');"
         "import run_tests;"
-        "exit_code = run_tests.run();"
+        "exit_code = run_tests.run({!r});"
         "sys.exit(exit_code);"
-    ).format(os.path.dirname(__file__))
+    ).format(os.path.dirname(__file__), suites or None)
+
+    # Find all the executables before launching any process.
+    executables = [find_mayapy(x) for x in versions]
+    for version, executable in zip(versions, executables):
+        if executable is None:
+            print("Unable to find mayapy for maya {}.".format(version))
+            return 1
+
+    # Only isolate the outputs when several processes run at the same time.
+    concurrent = min(jobs, len(versions)) > 1
+
     exit_code = 0
-    for version in versions or [None]:
-        try:
-            argv = [find_mayapy(version), "-c", command]
-            exit_code = subprocess.check_call(argv)
-        except subprocess.CalledProcessError:
-            exit_code = 1
+    for index in range(0, len(versions), jobs):
+        processes = [
+            subprocess.Popen(
+                [executable, "-c", command],
+                env=_environ(x) if concurrent else None,
+            )
+            for x, executable in zip(
+                versions[index : index + jobs],
+                executables[index : index + jobs],
+            )
+        ]
+        for process in processes:
+            if process.wait() != 0:
+                exit_code = 1
     return exit_code
 
 
-def run():
-    """Entry point."""
+def _environ(version):
+    """Build the environment of the process that runs the given version.
+
+    Only used when several processes run at the same time from the same
+    directory, so each of them writes its coverage data, coverage report and
+    pytest cache in its own location.
+    """
+    env = os.environ.copy()
+    env["COVERAGE_FILE"] = ".coverage-{}".format(version)
+    env["HTMLCOV_DIR"] = "htmlcov-{}".format(version)
+    env["PYTEST_ADDOPTS"] = " ".join(
+        filter(
+            None,
+            [
+                env.get("PYTEST_ADDOPTS"),
+                "-o cache_dir=.pytest_cache-{}".format(version),
+            ],
+        )
+    )
+    return env
+
+
+def run(suites=None):
+    """Entry point.
+
+    Maya standalone is only initialized once, then each suite is run in the
+    same session.
+
+    Arguments:
+        suites (list, optional): The name of the suites to run. By default,
+            only run the ``unit`` suite.
+
+    Returns:
+        int: The exit code, zero if all the suites succeed.
+    """
     from maya import standalone
 
     standalone.initialize()
@@ -42,17 +130,20 @@ def run():
     os.chdir(root)
 
     argv = [
-        "src",
-        "tests",
-        # "--doctest-modules",
         "--cov=src",
         "--cov-report=term",
-        "--cov-report=html",
+        "--cov-report=html:" + os.environ.get("HTMLCOV_DIR", "htmlcov"),
         "--showlocals",
         "-v",
     ]
     argv.extend(sys.argv[1:])
-    status = pytest.main(argv)
+
+    status = 0
+    for index, suite in enumerate(suites or ["unit"]):
+        # Accumulate the coverage data of all the suites.
+        extra = ["--cov-append"] if index else []
+        code = pytest.main(SUITES[suite] + argv + extra)
+        status = status or code
 
     standalone.uninitialize()
     return status
@@ -69,6 +160,10 @@ def find_mayapy(version=None):
     Returns:
         str: The path to the mayapy executable.
     """
+    if version in _MAYAPY_CACHE:
+        return _MAYAPY_CACHE[version]
+    requested = version
+
     path = {
         "win32": os.path.normpath("C:/Program Files/Autodesk/"),
         "darwin": os.path.normpath("/Applications/Autodesk/"),
@@ -78,9 +173,10 @@ def find_mayapy(version=None):
     if version is None:
         # Search for the most recent version of maya.
         for each in os.listdir(path):
-            if not re.match(r"(M|m)aya[0-9]{4}(-x64)?", each):
+            match = _MAYA_DIRECTORY_REGEX.match(each)
+            if match is None:
                 continue
-            number = int(each[4:].replace("-x64", ""))
+            number = int(match.group(1))
             if number > (version or 0):
                 version = number
 
@@ -92,7 +188,8 @@ def find_mayapy(version=None):
         path += ".exe"
 
     if not os.path.exists(path):
-        return None
+        path = None
+    _MAYAPY_CACHE[requested] = path
     return path
 
 
@@ -1,41 +1,40 @@
 """Populate the color configuration."""
 import os
-import re
 import sys
 
 import webcolors
-import yaml
 
-
-def clean_list(match):
-    """Convert yaml list to one-line."""
-    data = match.group(0).split("\n")
-    data = [x.replace("-", "").strip() for x in data if x]
-    return " {}\n".format(str(data).replace("'", ""))
+# The yaml representation of each color. Written by hand as the format of the
+# file is very simple, which avoid to post-process the output of a dumper.
+COLOR_TEMPLATE = """{name}:
+  hex: "{hex}"
+  percent: [{percent}]
+  rgb: [{rgb}]
+"""
 
 
 def main():
     """Find a populate the configuration file."""
     # Find the yaml config file path.
     base = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    config = os.path.join(base, "src", "ftd", "configs", "colors.yaml")
+    config = os.path.join(base, "src", "ftd", "resources", "colors.yaml")
 
     # Find the color data.
-    colors = {}
-    for color in webcolors.CSS3_NAMES_TO_HEX:
-        colors[color] = {
-            "hex": webcolors.name_to_hex(color),
-            "rgb": list(webcolors.name_to_rgb(color)),
-            "percent": list(webcolors.name_to_rgb_percent(color)),
+    colors = []
+    for color, hex_ in sorted(webcolors.CSS3_NAMES_TO_HEX.items()):
+        rgb = [int(hex_[i : i + 2], 16) for i in (1, 3, 5)]
+        percent = webcolors.rgb_to_rgb_percent(rgb)
+        data = {
+            "name": color,
+            "hex": hex_,
+            "rgb": ", ".join(str(x) for x in rgb),
+            "percent": ", ".join(x.rstrip("%") for x in percent),
         }
+        colors.append(COLOR_TEMPLATE.format(**data))
 
     # Write the color data to the config file.
-    raw = yaml.dump(colors)
-    for search, replace in {"'": '"', "%": ""}.items():
-        raw = raw.replace(search, replace)
-    raw = re.sub(r"\n(?: *(?:- .*\n))+", clean_list, raw)
     with open(config, "w") as stream:
-        stream.write(raw)
+        stream.write("".join(colors))
 
     return 0
 
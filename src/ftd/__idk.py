@@ -1,11 +1,15 @@
 from __future__ import division
 
+import collections
 import contextlib
 import functools
 import math
 
 from maya import cmds, mel
-from maya.api import OpenMaya
+
+# Functions compiled by `exec_string`, the least recently used are dropped.
+_COMPILED = collections.OrderedDict()
+_COMPILED_SIZE = 128
 
 
 @contextlib.contextmanager
@@ -42,10 +46,11 @@ def create_and_match(func):
             return [func_return]
 
         list_return = []
-        for _, node in enumerate(selection):
+        match_transform = cmds.matchTransform
+        for node in selection:
             func_return = func(*args, **kwargs)
             if node:
-                cmds.matchTransform(func_return, node)
+                match_transform(func_return, node)
             list_return.append(func_return)
 
         cmds.select(list_return)
@@ -95,17 +100,29 @@ def barycentric_coordinates(a, b, c, point):
     Returns:
         tuple: The generated coordinates.
     """
-    a, b, c, p = map(OpenMaya.MPoint, (a, b, c, point))
-
-    global_area = ((b - a) ^ (c - a)).length()
+    # The areas are computed with plain python floats rather than going
+    # through maya points, which is a lot cheaper for only a few operations.
+    inverse = 1.0 / _double_area(a, b, c)
     coordinates = (
-        ((b - p) ^ (c - p)).length() / global_area,
-        ((c - p) ^ (a - p)).length() / global_area,
-        ((a - p) ^ (b - p)).length() / global_area,
+        _double_area(point, b, c) * inverse,
+        _double_area(point, c, a) * inverse,
+        _double_area(point, a, b) * inverse,
     )
     return coordinates
 
 
+def _double_area(origin, u, v):
+    # pylint: disable=invalid-name
+    """Compute twice the area of the triangle formed by the three points."""
+    ox, oy, oz = origin[0], origin[1], origin[2]
+    ux, uy, uz = u[0] - ox, u[1] - oy, u[2] - oz
+    vx, vy, vz = v[0] - ox, v[1] - oy, v[2] - oz
+    x = uy * vz - uz * vy
+    y = uz * vx - ux * vz
+    z = ux * vy - uy * vx
+    return math.sqrt(x * x + y * y + z * z)
+
+
 def exec_string(string, language="python", decorators=None):
     """Execute a string as python code.
 
@@ -157,6 +174,30 @@ def exec_string(string, language="python", decorators=None):
     Raises:
         ValueError: The specified language is not supported by the function.
     """
+    callback = _build_callback(string, language)
+
+    for decorator in decorators or []:
+        try:
+            callback = decorator()(callback)
+        except TypeError:
+            callback = decorator(callback)
+
+    return callback()
+
+
+def _build_callback(string, language):
+    """Build the function that executes the string.
+
+    The functions are cached by string and language, so executing the same
+    string again does not compile it again. Only the most recently used
+    functions are kept.
+    """
+    key = (string, language)
+    if key in _COMPILED:
+        # Move the function at the end to keep the most recent ones.
+        _COMPILED[key] = _COMPILED.pop(key)
+        return _COMPILED[key]
+
     lines = ["def _callback():\n"]
 
     if language == "python":
@@ -168,13 +209,10 @@ def exec_string(string, language="python", decorators=None):
         msg = "The language '{}' is not supported.".format(language)
         raise ValueError(msg)
 
-    exec((" " * 4).join(lines))  # pylint: disable=exec-used
-    callback = locals()["_callback"]
-
-    for decorator in decorators or []:
-        try:
-            callback = decorator()(callback)
-        except TypeError:
-            callback = decorator(callback)
-
-    return callback()
+    namespace = {}
+    code = compile((" " * 4).join(lines), "<exec_string>", "exec")
+    exec(code, globals(), namespace)  # pylint: disable=exec-used
+    _COMPILED[key] = namespace["_callback"]
+    if len(_COMPILED) > _COMPILED_SIZE:
+        _COMPILED.popitem(last=False)
+    return _COMPILED[key]
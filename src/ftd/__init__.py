@@ -1,32 +1,50 @@
 """Root package."""
 import logging
-import logging.config
 
 __all__ = ["__version__"]
 __version__ = "0.1.0"
 
 # logging setup
 LOG_FORMAT = "(%(asctime)s) %(levelname)s [%(name)s.%(funcName)s]: %(message)s"
-LOG_CONFIG = {
-    "version": 1,
-    "disable_existing_loggers": False,
-    "formatters": {
-        "defaultFormatter": {"format": LOG_FORMAT, "datefmt": "%H:%M:%S"}
-    },
-    "handlers": {
-        "defaultHandler": {
-            "level": "INFO",
-            "class": "logging.StreamHandler",
-            "formatter": "defaultFormatter",
-        }
-    },
-    "loggers": {
-        __name__: {
-            "level": "INFO",
-            "propagate": False,
-            "handlers": ["defaultHandler"],
-        },
-    },
-}
-logging.config.dictConfig(LOG_CONFIG)
+LOG_DATE_FORMAT = "%H:%M:%S"
+_LOG_CONFIGURED = False
+
+
+def configure_logging():
+    """Configure the loggers of the package.
+
+    The configuration is deferred until the first record is emitted by one of
+    the loggers of the package, so importing it stays cheap. Only the logger
+    of the package is configured, the logging setup of the host application
+    is left untouched. Only the first call has an effect.
+    """
+    global _LOG_CONFIGURED  # pylint: disable=global-statement
+    if _LOG_CONFIGURED:
+        return
+    _LOG_CONFIGURED = True
+
+    handler = logging.StreamHandler()
+    handler.setLevel(logging.INFO)
+    handler.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT))
+
+    logger = logging.getLogger(__name__)
+    for each in logger.handlers[:]:
+        if isinstance(each, _LazyHandler):
+            logger.removeHandler(each)
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+class _LazyHandler(logging.Handler):
+    """Configure the logging on the first record then forward it."""
+
+    def emit(self, record):
+        configure_logging()
+        logging.getLogger(__name__).handle(record)
+
+
 LOG = logging.getLogger(__name__)
+LOG.setLevel(logging.INFO)
+LOG.propagate = False
+LOG.addHandler(_LazyHandler())
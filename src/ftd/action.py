@@ -8,14 +8,24 @@ import yaml
 ACTIONS = {}
 DECORATORS = {}
 
+# Use the libyaml bindings when they are available.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_CAMEL_CASE_REGEX = re.compile(r"(?<!^)([A-Z])")
+_NON_WORD_REGEX = re.compile(r"\W")
+
 
 def execute(action):
-    """Execute the given action."""
-    tokens = action.split("@")
-    act = ACTIONS.get(tokens.pop(0))
+    """Execute the given action.
+
+    A variant of the action can be executed using the ``action@variant``
+    synthax.
+    """
+    identifier, _, variant = action.partition("@")
+    act = ACTIONS.get(identifier)
     if act is None:
         raise ValueError("No action named '{}'.".format(action))
-    return act.execute(*tokens)
+    return act.execute(variant or None)
 
 
 class Action(object):
@@ -40,8 +50,8 @@ class Action(object):
 
     def __init__(self, identifier):
         self.identifier = identifier
-        normalized = re.sub(r"(?<!^)([A-Z])", r" \1", identifier)
-        self.name = re.sub(r"\W", "_", normalized).lower()
+        normalized = _CAMEL_CASE_REGEX.sub(r" \1", identifier)
+        self.name = _NON_WORD_REGEX.sub("_", normalized).lower()
 
         self.description = ""
         self.icon = ["commandButton.png"]
@@ -54,7 +64,24 @@ class Action(object):
         self.decorators = []
         self.code = ""
 
-        self.variants = []
+        self._variants = []
+        self._variants_index = None
+
+        self._callables = {}
+
+    @property
+    def variants(self):
+        """list: The variants of the action.
+
+        Assigning new variants resets the index used by
+        :meth:`get_variant_data`.
+        """
+        return self._variants
+
+    @variants.setter
+    def variants(self, value):
+        self._variants = value
+        self._variants_index = None
 
     def build_function(self, variant=None, module=False):
         """Convert the code into a string function."""
@@ -88,12 +115,32 @@ class Action(object):
         return "\n".join(lines)
 
     def build_callable(self, variant=None):
-        """Build a callable function."""
+        """Build a callable function.
+
+        The built callables are cached using their source code and decorators,
+        so the code is only compiled again if one of them has changed. The
+        decorators are part of the key with the function registered in
+        :data:`DECORATORS`, so registering another function under the same
+        name also builds the callable again.
+
+        The code is executed in a copy of the globals of this module, the
+        module level names remain available to the actions.
+        """
+        source = self.build_function(variant)
+        key = (source, tuple((x, DECORATORS[x]) for x in self.decorators))
+        cmd = self._callables.get(key)
+        if cmd is not None:
+            return cmd
+
         # pylint: disable=exec-used
-        exec(self.build_function(variant))
-        cmd = locals()[self._FUNCTION]
+        filename = "<action:{}>".format(self.identifier)
+        namespace = dict(globals())
+        exec(compile(source, filename, "exec"), namespace)
+        cmd = namespace[self._FUNCTION]
         for decorator in self.decorators:
             cmd = DECORATORS[decorator](cmd)
+
+        self._callables[key] = cmd
         return cmd
 
     def execute(self, variant=None):
@@ -101,11 +148,18 @@ class Action(object):
         return self.build_callable(variant)()
 
     def get_variant_data(self, name):
-        """Get the variant data."""
-        for variant in self.variants:
-            if variant.get("name") == name:
-                return variant
-        raise NameError("Unknown variant")
+        """Get the variant data.
+
+        The variants are indexed by name on the first lookup. The index is
+        reset when :attr:`variants` is assigned, so the variants must be
+        assigned again after being edited in place.
+        """
+        if self._variants_index is None:
+            self._variants_index = {x.get("name"): x for x in self.variants}
+        try:
+            return self._variants_index[name]
+        except KeyError:
+            raise NameError("Unknown variant")
 
     def to_dict(self):
         """Convert the action to a python dictionary."""
@@ -124,7 +178,7 @@ class Action(object):
 def load_actions_from_file(path):
     """Register the actions from a given YAML file."""
     with open(path, "r") as stream:
-        actions = yaml.load(stream, Loader=yaml.FullLoader)
+        actions = yaml.load(stream, Loader=_YAML_LOADER)
 
     for identifier, config in actions.items():
         action = Action.from_dict(identifier, config or {})
@@ -134,7 +188,7 @@ def load_actions_from_file(path):
 def load_decorators_from_file(path):
     """Tg."""
     with open(path, "r") as stream:
-        decorators = yaml.load(stream, Loader=yaml.FullLoader)
+        decorators = yaml.load(stream, Loader=_YAML_LOADER)
 
     for identifier, path in decorators.items():
         mod, func_name = path.rsplit(".", 1)
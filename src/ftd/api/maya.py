@@ -3,10 +3,13 @@
 from __future__ import absolute_import, division
 
 import abc
+import collections
 import logging
 import math
+import re
 import sys
 import types
+import weakref
 
 from maya import cmds
 from maya.api import OpenMaya
@@ -35,19 +38,44 @@ __all__ = [
 
 LOG = logging.getLogger(__name__)
 
+# Nodes previously encoded from a name, the oldest names are dropped first.
+_NAME_CACHE = collections.OrderedDict()
+_NAME_CACHE_SIZE = 4096
+
+# Node names without any pattern, that can be resolved without `cmds.ls()`.
+_EXACT_NAME_REGEX = re.compile(r"^[\w|:]+$")
+
+# Selection lists reused to resolve the names.
+_SELECTION_POOL = []
+_SELECTION_POOL_SIZE = 32
+
 # Pytohn 2 & 3 compatibility.
 # pylint: disable=undefined-variable
 _STRING_TYPES = str if sys.version_info[0] >= 3 else basestring  # type: ignore
 # pylint: enable=undefined-variable
+_BUILTIN_TYPES = frozenset((bool, float, int, str, type(u""), type(None)))
+
+# Function set identifiers checked in the loops over the DAG.
+_MFN_SHAPE = OpenMaya.MFn.kShape
+_MFN_WORLD = OpenMaya.MFn.kWorld
 
 
-def _add_metaclass(metaclass):
-    """Add a metaclass compatible with python 2 and 3"""
+def _with_metaclass(metaclass, *bases):
+    """Create a base class with a metaclass compatible with python 2 and 3.
 
-    def _decorator(cls):
-        return metaclass(cls.__name__, cls.__bases__, cls.__dict__.copy())
+    The temporary class returned is replaced by the final class the first time
+    it is derived, so the final class is only built once by the metaclass.
+    """
+
+    class _TemporaryMeta(type):
+        def __new__(mcs, name, _, dict_):
+            return metaclass(name, bases, dict_)
 
-    return _decorator
+        @classmethod
+        def __prepare__(mcs, name, _):
+            return metaclass.__prepare__(name, bases)
+
+    return type.__new__(_TemporaryMeta, "_TemporaryClass", (), {})
 
 
 # Errors
@@ -68,6 +96,27 @@ def newscene():
 def clear():
     """Remove all instances stored in the memory."""
     _MetaNode._instances.clear()
+    _NAME_CACHE.clear()
+
+
+def _clear_callback(*_):
+    """Remove all instances when the scene is about to change."""
+    clear()
+
+
+# Remove the callbacks registered by a previous load of the module, they
+# still point to the functions of the stale module.
+for _callback in globals().get("_CALLBACKS", ()):
+    OpenMaya.MMessage.removeCallback(_callback)
+
+# The hash codes can be reused by the nodes of the next scene.
+_CALLBACKS = [
+    OpenMaya.MSceneMessage.addCallback(message, _clear_callback)
+    for message in (
+        OpenMaya.MSceneMessage.kBeforeNew,
+        OpenMaya.MSceneMessage.kBeforeOpen,
+    )
+]
 
 
 # Enum
@@ -130,49 +179,120 @@ def encode(obj, default=object):
 
     Raises:
         TypeError: The type of the object is not supported.
-        ValueError: The object does not exist and the `default` parameter
-            is not specified.
+        ValueError: The object does not exist (or is a component) and the
+            `default` parameter is not specified.
     """
-    LOG.debug("Encoding: %s", repr(obj))
+    LOG.debug("Encoding: %r", obj)
 
-    # Check if the object is not already encoded.
-    if obj.__class__.__module__ == __name__:
-        return obj
+    # The checks are ordered from the most common type of object to the least
+    # common one. Most of the objects to encode are plain strings, skip the
+    # isinstance check for them.
+    if type(obj) is str or isinstance(obj, _STRING_TYPES):
+        node = _find_cached_name(obj)
+        if node is not None:
+            return node
 
-    if isinstance(obj, _STRING_TYPES):
-        sel = OpenMaya.MSelectionList()
+        sel = _acquire_selection()
         try:
             sel.add(obj)
             if "." in obj:
-                obj = sel.getPlug(0)
-            else:
-                obj = sel.getDependNode(0)
-        except RuntimeError:
+                return Plug(sel.getPlug(0))
+            mobject = sel.getDependNode(0)
+        except (RuntimeError, TypeError):
+            # A TypeError is raised when the name is not a plug but a
+            # component (e.g. "pCube1.vtx[0]").
             if default is not object:
                 return default
             raise ValueError("The object '{}' does not exists.".format(obj))
+        finally:
+            _release_selection(sel)
+
+        node = _encode_mobject(mobject)
+        _cache_name(obj, node)
+        return node
+
+    if isinstance(obj, OpenMaya.MObject):
+        return _encode_mobject(obj)
 
     if isinstance(obj, OpenMaya.MPlug):
         return Plug(obj)
 
-    if not isinstance(obj, OpenMaya.MObject):
-        msg = "The object type {} is not supported."
-        raise TypeError(msg.format(type(obj)))
+    # Check if the object is not already encoded.
+    if isinstance(obj, _ENCODED_TYPES):
+        return obj
+
+    msg = "The object type {} is not supported."
+    raise TypeError(msg.format(type(obj)))
+
+
+def _encode_mobject(mobject):
+    """Encode a maya object in the most appropriate registered class."""
+    # The result only depends on the api type of the object, so it is cached.
+    api_type = mobject.apiType()
+    cls = _MetaNode._api_types.get(api_type)
+    if cls is None:
+        for identifier, cls in _MetaNode._dispatch:
+            if mobject.hasFn(identifier):
+                _MetaNode._api_types[api_type] = cls
+                break
+        else:
+            msg = "Failed to encode the object '{}'"
+            raise ValueError(msg.format(mobject))
+    return cls(mobject)
+
+
+def _acquire_selection():
+    """Get an empty selection list from the pool."""
+    if _SELECTION_POOL:
+        return _SELECTION_POOL.pop()
+    return OpenMaya.MSelectionList()
+
+
+def _release_selection(sel):
+    """Give back a selection list to the pool."""
+    if len(_SELECTION_POOL) < _SELECTION_POOL_SIZE:
+        sel.clear()
+        _SELECTION_POOL.append(sel)
 
-    # Find the most appropriate class in which the object can be encoded.
-    for each in reversed(OpenMaya.MGlobal.getFunctionSetList(obj)):
-        cls = _MetaNode._types.get(getattr(OpenMaya.MFn, each))
-        if cls is not None:
-            return cls(obj)
 
-    raise ValueError("Failed to encode the object '{}'".format(obj))
+def _find_cached_name(name):
+    """Find the node previously encoded from the given name.
+
+    The node is only returned if it is still alive and still has the same
+    name, otherwise the name is removed from the cache.
+    """
+    handle = _NAME_CACHE.get(name)
+    if handle is None:
+        return None
+
+    node = _MetaNode._instances.get(handle.hashCode())
+    if (
+        node is not None
+        and handle.isValid()
+        and handle.isAlive()
+        and node.handle is handle
+        and node._matches_name(name)
+    ):
+        # Move the name at the end to keep the most recent names.
+        _NAME_CACHE[name] = _NAME_CACHE.pop(name)
+        return node
+
+    del _NAME_CACHE[name]
+    return None
+
+
+def _cache_name(name, node):
+    """Remember the node encoded from the given name."""
+    _NAME_CACHE[name] = node.handle
+    if len(_NAME_CACHE) > _NAME_CACHE_SIZE:
+        _NAME_CACHE.popitem(last=False)
 
 
 def decode(obj, **kwargs):
     """Decode an object."""
-    LOG.debug("Decode: %s", repr(obj))
+    LOG.debug("Decode: %r", obj)
 
-    if obj.__class__.__module__ != __name__:
+    if not isinstance(obj, _ENCODED_TYPES):
         return obj
 
     if hasattr(obj, "decode"):
@@ -182,14 +302,60 @@ def decode(obj, **kwargs):
 
 
 def ls(*args, **kwargs):
-    """Todo."""
-    return _wrap(cmds.ls, *args, **kwargs)
+    """List the nodes of the scene.
+
+    Wrap the `cmds.ls()`_ command. When only exact node names are specified,
+    the nodes are directly retrieved through the api so that the names
+    returned by the command does not need to be resolved one by one. The
+    command is still used if a name matches more than one node.
+
+    Arguments:
+        *args: The arguments passed to the `cmds.ls()`_ command.
+        **kwargs: The keyword arguments passed to the `cmds.ls()`_ command.
+
+    Returns:
+        list: The encoded nodes.
+
+    .. _cmds.ls():
+        https://help.autodesk.com/cloudhelp/2022/ENU/Maya-Tech-Docs/CommandsPython/ls.html
+    """
+    if (
+        kwargs
+        or not args
+        or len(set(args)) != len(args)
+        or not all(
+            isinstance(x, _STRING_TYPES) and _EXACT_NAME_REGEX.match(x)
+            for x in args
+        )
+    ):
+        return _wrap(cmds.ls, *args, **kwargs)
+
+    nodes = []
+    sel = _acquire_selection()
+    try:
+        for name in args:
+            sel.clear()
+            try:
+                sel.add(name)
+            except RuntimeError:
+                # The command ignores the names that do not exist.
+                continue
+            if sel.length() != 1:
+                return _wrap(cmds.ls, *args)
+            nodes.append(_encode_mobject(sel.getDependNode(0)))
+    finally:
+        _release_selection(sel)
+
+    # Let the command decide how several names of the same node are listed.
+    if len(set(nodes)) != len(nodes):
+        return _wrap(cmds.ls, *args)
+    return nodes
 
 
 def selected():
     """Return the current selected nodes."""
-    selection = OpenMaya.MGlobal.getActiveSelectionList().getSelectionStrings()
-    return map(encode, selection)
+    sel = OpenMaya.MGlobal.getActiveSelectionList()
+    return [_encode_mobject(sel.getDependNode(i)) for i in range(sel.length())]
 
 
 # Nodes
@@ -205,12 +371,27 @@ class _MetaNode(type):
     """
 
     _types = {}
-    _instances = {}
+    _api_types = {}
+    _dispatch = []
+    # The instances are only kept alive as long as they are used somewhere
+    # else, the wrappers of the deleted nodes are then released with them.
+    _instances = weakref.WeakValueDictionary()
 
     def __new__(mcs, name, bases, dict_):
         """Register all new classes that derive from this metaclass."""
         cls = super(_MetaNode, mcs).__new__(mcs, name, bases, dict_)
         mcs._types[cls._identifier] = cls
+
+        # Keep the classes sorted from the most specific to the most generic,
+        # so that the first function set supported by an object is the best.
+        mcs._dispatch[:] = sorted(
+            mcs._types.items(),
+            key=lambda x: len(x[1].__mro__),
+            reverse=True,
+        )
+
+        # A new class can change the way the objects are encoded.
+        mcs._api_types.clear()
         return cls
 
     def __call__(cls, mobject, *args, **kwargs):
@@ -283,29 +464,32 @@ class _MetaNode(type):
 
         self = cls._instances.get(hash_code)
         if not self:
-            self = super(_MetaNode, cls).__call__(mobject, *args, **kwargs)
+            # Reuse the handle instead of creating a new one in __init__.
+            self = cls.__new__(cls)
             self._handle = handle
+            self.__init__(mobject, *args, **kwargs)
             cls._instances[hash_code] = self
         return self
 
 
-@_add_metaclass(_MetaNode)
-class DependencyNode(object):
+class DependencyNode(_with_metaclass(_MetaNode, object)):
     """A Dependency Graph (DG) node."""
 
+    __slots__ = ("_object", "_fn", "_handle", "__weakref__")
+
     _class = OpenMaya.MFnDependencyNode
     _identifier = OpenMaya.MFn.kDependencyNode
 
     def __repr__(self):
         return "<{} '{}' type::{}>".format(
             self.__class__.__name__,
-            self.fn.name(),
+            self.name,
             self.fn.typeName,
         )
 
     # Type conversion ---
     def __str__(self):
-        return self.fn.name()
+        return self.name
 
     def __bool__(self):
         return True
@@ -330,14 +514,18 @@ class DependencyNode(object):
 
     # Comparison operators ---
     def __eq__(self, other):
+        # The instances are unique for each node.
+        if self is other:
+            return True
         if isinstance(other, DependencyNode):
-            return self.object == other.object
+            return self._handle == other._handle
         return str(self) == str(other)
 
     def __ne__(self, other):
-        if isinstance(other, DependencyNode):
-            return self.object != other.object
-        return str(self) != str(other)
+        return not self == other
+
+    def __hash__(self):
+        return self._handle.hashCode()
 
     # Emmulate container type ---
     def __getitem__(self, key):
@@ -349,8 +537,7 @@ class DependencyNode(object):
     # Constructor ---
     def __init__(self, mobject):
         self._object = mobject
-        self._fn = self._class(mobject)
-        self._handle = OpenMaya.MObjectHandle(mobject)
+        self._fn = None
 
     # Read properties ---
     @property
@@ -367,6 +554,10 @@ class DependencyNode(object):
     def fn(self):
         # pylint: disable=invalid-name
         """MFnDependencyNode: The maya function set attached to self."""
+        # The function set is only created when it is needed for the first
+        # time, as many nodes are only encoded to be compared.
+        if self._fn is None:
+            self._fn = self._class(self._object)
         return self._fn
 
     @property
@@ -500,7 +691,7 @@ class DependencyNode(object):
         Raises:
             ValueError: The attribute does not exists on the node.
         """
-        LOG.debug("Acess '%s.%s'", self.name, attribute)
+        LOG.debug("Acess '%s.%s'", self, attribute)
         try:
             return Plug(self.fn.findPlug(attribute, False))
         except RuntimeError:
@@ -508,11 +699,29 @@ class DependencyNode(object):
             raise ValueError(message.format(self, attribute))
 
     def history(self, filter=None):
-        """Search in the node history."""
+        """Search in the node history.
+
+        Arguments:
+            filter (str, tuple, int): Filter the returned node types. The
+                function set identifiers (``MFn.k*``) are checked before the
+                nodes are encoded.
+
+        Yield:
+            DependencyNode: The next node of the history.
+        """
         return self._related(OpenMaya.MItDependencyGraph.kUpstream, filter)
 
     def future(self, filter=None):
-        """Search in the future of the node."""
+        """Search in the future of the node.
+
+        Arguments:
+            filter (str, tuple, int): Filter the returned node types. The
+                function set identifiers (``MFn.k*``) are checked before the
+                nodes are encoded.
+
+        Yield:
+            DependencyNode: The next node of the future.
+        """
         return self._related(OpenMaya.MItDependencyGraph.kDownstream, filter)
 
     def istype(self, filter, strict=False):
@@ -534,29 +743,60 @@ class DependencyNode(object):
         return any(x in self.inherited for x in filter)
 
     # Private methods ---
+    def _matches_name(self, name):
+        """Check if the name still designates the node."""
+        return self.fn.name() == name
+
     def _related(self, direction, filter=None):
         """Retrive node through the graph."""
+        # Let the iterator skip the nodes that does not match the function
+        # set, they then never need to be encoded.
+        fn_filter = OpenMaya.MFn.kInvalid
+        fn_filters = ()
+        if isinstance(filter, int):
+            fn_filter, filter = filter, None
+        elif filter and all(isinstance(x, int) for x in filter):
+            # Multiple function sets are checked on the maya objects, still
+            # before any encoding.
+            fn_filters, filter = tuple(filter), None
+
         iterator = OpenMaya.MItDependencyGraph(
             self.object,
-            direction,
+            filter=fn_filter,
+            direction=direction,
             traversal=OpenMaya.MItDependencyGraph.kDepthFirst,
             level=OpenMaya.MItDependencyGraph.kNodeLevel,
         )
 
-        # Skip self.
-        iterator.next()
+        # The iterator only returns maya objects, so they can be directly
+        # encoded without going through all the checks of `encode`.
+        current, next_, done, encode_ = (
+            iterator.currentNode,
+            iterator.next,
+            iterator.isDone,
+            _encode_mobject,
+        )
+
+        # Skip self, which is not returned if it does not match the filter.
+        if not done() and current() == self.object:
+            next_()
 
-        while not iterator.isDone():
-            node = encode(iterator.currentNode())
-            # print(node.type, filter)
+        while not done():
+            mobject = current()
+            if fn_filters and not any(mobject.hasFn(x) for x in fn_filters):
+                next_()
+                continue
+            node = encode_(mobject)
             if filter is None or node.type in filter:
                 yield node
-            iterator.next()
+            next_()
 
 
 class DagNode(DependencyNode):
     """A Directed Acyclic Graph (DAG) node."""
 
+    __slots__ = ("_dagpath",)
+
     _class = OpenMaya.MFnDagNode
     _identifier = OpenMaya.MFn.kDagNode
 
@@ -568,12 +808,14 @@ class DagNode(DependencyNode):
 
     def __init__(self, mobject):
         super(DagNode, self).__init__(mobject)
-        self._dagpath = OpenMaya.MDagPath.getAPathTo(self.object)
+        self._dagpath = None
 
     # Read properties ---
     @property
     def dagpath(self):
         """MDagPath: The dag path instance associated to the node."""
+        if self._dagpath is None:
+            self._dagpath = OpenMaya.MDagPath.getAPathTo(self._object)
         return self._dagpath
 
     @property
@@ -633,8 +875,8 @@ class DagNode(DependencyNode):
         # The `parentCount` and `parent` (with an index other than 0)
         # methods seem does not to work...
         mobject = self.fn.parent(0)
-        while mobject.apiType() != OpenMaya.MFn.kWorld:
-            parent = encode(mobject)
+        while mobject.apiType() != _MFN_WORLD:
+            parent = _encode_mobject(mobject)
             if _match_filter(parent, filter, strict):
                 yield parent
             mobject = parent.fn.parent(0)
@@ -742,10 +984,11 @@ class DagNode(DependencyNode):
         Yield:
             Shape: The next shape node.
         """
-        for index in range(self.fn.childCount()):
-            obj = self.fn.child(index)
-            if obj.hasFn(OpenMaya.MFn.kShape):
-                child = encode(obj)
+        fn = self.fn
+        for index in range(fn.childCount()):
+            obj = fn.child(index)
+            if obj.hasFn(_MFN_SHAPE):
+                child = _encode_mobject(obj)
                 if _match_filter(child, filter, strict):
                     yield child
 
@@ -785,11 +1028,12 @@ class DagNode(DependencyNode):
         Yield:
             DagNode: The next child node.
         """
-        for index in range(self.fn.childCount()):
-            child = encode(self.fn.child(index))
+        fn = self.fn
+        for index in range(fn.childCount()):
+            child = _encode_mobject(fn.child(index))
 
             if _match_filter(child, filter, strict):
-                if not (child.object.hasFn(OpenMaya.MFn.kShape) and not shape):
+                if not (child.object.hasFn(_MFN_SHAPE) and not shape):
                     yield child
 
             if recurse:
@@ -851,6 +1095,18 @@ class DagNode(DependencyNode):
         self["visibility"] = True
 
     # Private methods ----
+    def _matches_name(self, name):
+        """Check if the name still designates the node.
+
+        The name of a DAG node can be its full path or its shortest unique
+        path, which stops being unique when another node gets the same name.
+        A path starting from the world can only be the full path, so a single
+        name is ever queried.
+        """
+        if name.startswith("|"):
+            return self.fn.fullPathName() == name
+        return self.fn.partialPathName() == name
+
     def _set_parent(self, parent):
         """Set the parent of self in the outliner."""
         if self.parent() == parent:
@@ -862,6 +1118,8 @@ class DagNode(DependencyNode):
 class Shape(DagNode):
     """A shape node."""
 
+    __slots__ = ()
+
     _identifier = OpenMaya.MFn.kShape
 
     def _set_parent(self, parent):
@@ -870,6 +1128,9 @@ class Shape(DagNode):
 
 def exists(obj):
     """Check if an object exists in the scene."""
+    # An encoded node already knows if its maya object is still in the scene.
+    if isinstance(obj, DependencyNode):
+        return obj.handle.isValid()
     return cmds.objExists(str(obj))
 
 
@@ -894,12 +1155,13 @@ def delete(*args, **kwargs):
     .. _cmds.delete():
         https://help.autodesk.com/cloudhelp/2022/ENU/Maya-Tech-Docs/CommandsPython/delete.html
     """
-    return _wrap(cmds.delete, *args, **kwargs)
+    args = [decode(x) for x in args]
+    kwargs = {k: decode(v) for k, v in kwargs.items()}
+    return cmds.delete(*args, **kwargs)
 
 
 # Creator
-@_add_metaclass(abc.ABCMeta)
-class Creator(object):
+class Creator(_with_metaclass(abc.ABCMeta, object)):
     """Allow to customize the creation of nodes."""
 
     identifier = None
@@ -970,13 +1232,18 @@ def create(type, name=None, **kwargs):
     if isinstance(type, Creator):
         return type.create(name)
 
-    return _wrap(cmds.createNode, type, name=name or type, **kwargs)
+    # The type and the name are always strings and the command returns a
+    # single name, only the keyword arguments may need to be decoded.
+    kwargs = {k: decode(v) for k, v in kwargs.items()}
+    return encode(cmds.createNode(type, name=name or type, **kwargs))
 
 
 # Plug & Attributes
 class Plug(object):
     """A plug object."""
 
+    __slots__ = ("_plug", "_node")
+
     def __repr__(self):
         return """<{} '{}' type::{}>""".format(
             self.__class__.__name__,
@@ -989,6 +1256,7 @@ class Plug(object):
 
     def __init__(self, mplug):
         self._plug = mplug
+        self._node = None
 
     # Read properties ---
     @property
@@ -999,7 +1267,9 @@ class Plug(object):
     @property
     def node(self):
         """DependencyNode: Get the associated node."""
-        return encode(self.plug.node())
+        if self._node is None:
+            self._node = _encode_mobject(self._plug.node())
+        return self._node
 
     @property
     def name(self):
@@ -1089,6 +1359,8 @@ class Plug(object):
 class Point(object):
     """3D point."""
 
+    __slots__ = ("_point",)
+
     def __repr__(self):
         return "<Vector {}>".format(self)
 
@@ -1114,52 +1386,59 @@ class Vector(object):
         z (float): The z component of the vector.
     """
 
+    __slots__ = ("_vector",)
+
     def __repr__(self):
         return "<Vector {}>".format(self)
 
     # Unary operators ---
     def __pos__(self):
         """Positive version of the vector (doesn't do anything)."""
-        return Vector(+self.x, +self.y, +self.z)
+        return self._from_api(OpenMaya.MVector(self._vector))
 
     def __neg__(self):
         """Negate all components of the vector."""
-        return Vector(-self.x, -self.y, -self.z)
+        return self._from_api(-self._vector)
 
     def __abs__(self):
         """Convert all negative components to positive."""
-        return Vector(abs(self.x), abs(self.y), abs(self.z))
+        vector = self._vector
+        return Vector(abs(vector.x), abs(vector.y), abs(vector.z))
 
     def __round__(self, ndigits=0):
         """Round all components of the vector."""
+        vector = self._vector
         return Vector(
-            round(self.x, ndigits),
-            round(self.y, ndigits),
-            round(self.z, ndigits),
+            round(vector.x, ndigits),
+            round(vector.y, ndigits),
+            round(vector.z, ndigits),
         )
 
     def __ceil__(self):
         """Converts all floating numbers to the next integer."""
+        vector = self._vector
         return Vector(
-            math.ceil(self.x),
-            math.ceil(self.y),
-            math.ceil(self.z),
+            math.ceil(vector.x),
+            math.ceil(vector.y),
+            math.ceil(vector.z),
         )
 
     def __floor__(self):
         """Converts all floating numbers to the previous integer."""
+        vector = self._vector
         return Vector(
-            math.floor(self.x),
-            math.floor(self.y),
-            math.floor(self.z),
+            math.floor(vector.x),
+            math.floor(vector.y),
+            math.floor(vector.z),
         )
 
     def __trunc__(self):
         """Converts all floating numbers to the closest integer."""
+        vector = self._vector
         return Vector(
-            math.trunc(self.x),
-            math.trunc(self.y),
-            math.trunc(self.z),
+            math.trunc(vector.x),
+            math.trunc(vector.y),
+            math.trunc(vector.z),
         )
 
     # Type conversion ---
@@ -1168,21 +1447,21 @@ class Vector(object):
 
     # Arithmetic operators ---
     def __add__(self, vector):
-        return self.from_mvector(self.vector + vector.vector)
+        return self._from_api(self.vector + vector.vector)
 
     def __sub__(self, vector):
-        return self.from_mvector(self.vector - vector.vector)
+        return self._from_api(self.vector - vector.vector)
 
     def __mul__(self, scalar):
         """Compute the dot product."""
-        return self.from_mvector(self.vector * scalar)
+        return self._from_api(self.vector * scalar)
 
     def __truediv__(self, scalar):
-        return self.from_mvector(self.vector / scalar)
+        return self._from_api(self.vector / scalar)
 
     def __xor__(self, vector):
         """Compute the cross product."""
-        return self.from_mvector(self.vector ^ vector.vector)
+        return self._from_api(self.vector ^ vector.vector)
 
     # Comparison operators ---
     def __eq__(self, vector):
@@ -1264,6 +1543,13 @@ class Vector(object):
         """Create a vector from a maya vector."""
         return cls(mvector.x, mvector.y, mvector.z)
 
+    @classmethod
+    def _from_api(cls, mvector):
+        """Wrap a maya vector that is not used anywhere else without copy."""
+        vector = cls.__new__(cls)
+        vector._vector = mvector
+        return vector
+
     # Read properties ---
     @property
     def vector(self):
@@ -1313,7 +1599,7 @@ class Vector(object):
     # Public methods ---
     def normal(self):
         """Normalized copy."""
-        return self.from_mvector(self.vector.normal())
+        return self._from_api(self.vector.normal())
 
     def normalize(self):
         """Inplace normalization."""
@@ -1333,9 +1619,15 @@ class Vector(object):
 class Matrix(object):
     """4x4 matrix."""
 
+    __slots__ = ("_matrix",)
+
+    # The template is only built once, it is filled with the 16 values.
+    _REPR = "<Matrix \n{}\n>".format(
+        "\n".join([" ".join(["{:7.3f}"] * 4)] * 4)
+    )
+
     def __repr__(self):
-        lines = "\n".join([" ".join(["{:7.3f}"] * 4)] * 4)
-        return "<Matrix \n{}\n>".format(lines.format(*self.decode(True)))
+        return self._REPR.format(*self.decode(True))
 
     # Type conversion ---
     def __str__(self):
@@ -1343,13 +1635,13 @@ class Matrix(object):
 
     # Arithmetic operators ---
     def __add__(self, matrix):
-        return self.from_mmatrix(self.matrix + matrix.matrix)
+        return self._from_api(self.matrix + matrix.matrix)
 
     def __mul__(self, matrix):
-        return self.from_mmatrix(self.matrix + matrix.matrix)
+        return self._from_api(self.matrix * matrix.matrix)
 
     def __sub__(self, matrix):
-        return self.from_mmatrix(self.matrix + matrix.matrix)
+        return self._from_api(self.matrix - matrix.matrix)
 
     # Comparison operators ---
     def __eq__(self, matrix):
@@ -1397,7 +1689,14 @@ class Matrix(object):
     @classmethod
     def from_mmatrix(cls, mmatrix):
         """Create a matrix from a maya matrix."""
-        return cls(*list(mmatrix))
+        return cls._from_api(OpenMaya.MMatrix(mmatrix))
+
+    @classmethod
+    def _from_api(cls, mmatrix):
+        """Wrap a maya matrix that is not used anywhere else without copy."""
+        matrix = cls.__new__(cls)
+        matrix._matrix = mmatrix
+        return matrix
 
     @classmethod
     def identity(cls):
@@ -1406,7 +1705,33 @@ class Matrix(object):
 
     @classmethod
     def compose(cls, translate=Vector(), rotate=Vector(), scale=Vector.one()):
-        """Compose a matrix from translate, rotate and scale value."""
+        """Compose a matrix from translate, rotate and scale value.
+
+        Examples:
+            >>> Matrix.compose(translate=Vector(1, 2, 3)).translate
+            <Vector (1.0, 2.0, 3.0)>
+            >>> matrix = Matrix.compose(rotate=Vector(0, 0, math.pi / 2))
+            >>> values = (0, 1, 0, 0, -1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1)
+            >>> matrix.matrix.isEquivalent(Matrix(*values).matrix)
+            True
+            >>> matrix = Matrix.compose(scale=Vector(1, 2, 3))
+            >>> [round(x, 3) for x in matrix.decode(flat=True)[::5]]
+            [1.0, 2.0, 3.0, 1.0]
+
+        Arguments:
+            translate (Vector): The translation of the matrix.
+            rotate (Vector): The rotation of the matrix in radians, using the
+                XYZ rotation order.
+            scale (Vector): The scale of the matrix.
+
+        Returns:
+            Matrix: The composed matrix.
+        """
+        transform = OpenMaya.MTransformationMatrix()
+        transform.setTranslation(translate.vector, Space.TRANSFORM)
+        transform.setRotation(OpenMaya.MEulerRotation(rotate.vector))
+        transform.setScale(tuple(scale), Space.TRANSFORM)
+        return cls._from_api(transform.asMatrix())
 
     # Read properties ---
     @property
@@ -1418,7 +1743,10 @@ class Matrix(object):
     @property
     def translate(self):
         """Vector: The translation component."""
-        return Vector.from_mvector(self.transform.translation(Space.WORLD))
+        # The translation is stored in the last row, there is no need to
+        # build a transformation matrix to read it.
+        matrix = self._matrix
+        return Vector(matrix[12], matrix[13], matrix[14])
 
     @translate.setter
     def translate(self, value):
@@ -1427,7 +1755,29 @@ class Matrix(object):
 
     # Public methods ---
     def decompose(self):
-        """Decompose matrix into translate, rotate and scale value."""
+        """Decompose matrix into translate, rotate and scale value.
+
+        The three components are read from the same transformation matrix,
+        with the rotation in radians using the XYZ rotation order.
+
+        Examples:
+            >>> t = Vector(1, 2, 3)
+            >>> r = Vector(0.5, -0.25, 1)
+            >>> s = Vector(1, 2, 3)
+            >>> result = Matrix.compose(t, r, s).decompose()
+            >>> pairs = zip(result, (t, r, s))
+            >>> [a.vector.isEquivalent(b.vector) for a, b in pairs]
+            [True, True, True]
+
+        Returns:
+            tuple: The translate, rotate and scale vectors.
+        """
+        transform = self.transform
+        return (
+            Vector.from_mvector(transform.translation(Space.TRANSFORM)),
+            Vector.from_mvector(transform.rotation().asVector()),
+            Vector(*transform.scale(Space.TRANSFORM)),
+        )
 
     def inverse(self):
         """Inverted copy of the matrix.
@@ -1435,7 +1785,7 @@ class Matrix(object):
         Returns:
             Matrix: The inverted matrix.
         """
-        return self.from_mmatrix(self.matrix.inverse())
+        return self._from_api(self.matrix.inverse())
 
     def decode(self, flat=False):
         """Decode the matrix into a two-dimensional array.
@@ -1446,22 +1796,19 @@ class Matrix(object):
         Returns:
             tuple: The decoded matrix.
         """
-        matrix = []
-        for i in range(4):
-            values = tuple(self.matrix.getElement(i, j) for j in range(4))
-            if flat:
-                matrix.extend(values)
-            else:
-                matrix.append(values)
-        return tuple(matrix)
+        # The maya matrix is iterated row by row in a single call.
+        values = tuple(self.matrix)
+        if flat:
+            return values
+        return tuple(values[i : i + 4] for i in range(0, 16, 4))
 
     def asrotate(self):
         """Create a matrix with the rotate component."""
-        self.from_mmatrix(self.transform.asRotateMatrix())
+        return self._from_api(self.transform.asRotateMatrix())
 
     def asscale(self):
         """Create a matrix with the scale component."""
-        self.from_mmatrix(self.transform.asScaleMatrix())
+        return self._from_api(self.transform.asScaleMatrix())
 
     # Aliases ---
     __neg__ = inverse
@@ -1470,6 +1817,8 @@ class Matrix(object):
 class EulerRotation(object):
     """3D rotation."""
 
+    __slots__ = ("_rotation",)
+
     XYZ = OpenMaya.MEulerRotation.kXYZ
     YZX = OpenMaya.MEulerRotation.kYZX
     ZXY = OpenMaya.MEulerRotation.kZXY
@@ -1489,6 +1838,13 @@ class EulerRotation(object):
 class Quaternion(object):
     """Quaternion math."""
 
+    __slots__ = ("_quaternion",)
+
+    # Arithmetic operators ---
+    def __mul__(self, quaternion):
+        return self._from_api(self.quaternion * quaternion.quaternion)
+
+    # Constructor ---
     def __init__(self, x=0, y=0, z=0, w=1):
         self._quaternion = OpenMaya.MQuaternion(x, y, z, w)
 
@@ -1497,6 +1853,31 @@ class Quaternion(object):
         """Create a quaternion from a maya quaternion."""
         return cls(mquaternion.x, mquaternion.y, mquaternion.z, mquaternion.w)
 
+    @classmethod
+    def _from_api(cls, mquaternion):
+        """Wrap a maya quaternion that is not used elsewhere without copy."""
+        quaternion = cls.__new__(cls)
+        quaternion._quaternion = mquaternion
+        return quaternion
+
+    # Read properties ---
+    @property
+    def quaternion(self):
+        """MQuaternion: The maya quaternion."""
+        return self._quaternion
+
+
+# All the types in which an object can be encoded.
+_ENCODED_TYPES = (
+    DependencyNode,
+    Plug,
+    Point,
+    Vector,
+    Matrix,
+    EulerRotation,
+    Quaternion,
+)
+
 
 # Utilities
 def _match_filter(node, filter, strict=False):
@@ -1507,15 +1888,16 @@ def _match_filter(node, filter, strict=False):
 def _wrap(func, *args, **kwargs):
     """To do."""
 
-    def _convert(func_, obj):
-        try:
-            return func_(obj)
-        except BaseException:
+    def _decode(obj):
+        # The builtin types never need to be decoded, and decode returns the
+        # other objects unchanged if they are not encoded.
+        if type(obj) in _BUILTIN_TYPES:
             return obj
+        return decode(obj)
 
     # First, decode each arguments
-    args_ = [_convert(decode, x) for x in args]
-    kwargs_ = {k: _convert(decode, v) for k, v in kwargs.items()}
+    args_ = [_decode(x) for x in args]
+    kwargs_ = {k: _decode(v) for k, v in kwargs.items()}
 
     # Execute the function
     returned = func(*args_, **kwargs_)
@@ -1524,12 +1906,54 @@ def _wrap(func, *args, **kwargs):
 
     # Finally encode the returned object(s)
     if isinstance(returned, _STRING_TYPES):
-        return _convert(encode, returned)
+        return encode(returned, default=returned)
     if isinstance(returned, (list, tuple, set)):
-        return type(returned)(_convert(encode, x) for x in returned)
+        return type(returned)(_encode_names(returned))
     return returned
 
 
+def _encode_names(names):
+    """Encode multiple names through a single selection list.
+
+    The names that cannot be encoded are returned unchanged.
+    """
+    sel = OpenMaya.MSelectionList()
+    indices = []
+    for name in names:
+        if not isinstance(name, _STRING_TYPES):
+            indices.append(None)
+            continue
+
+        length = sel.length()
+        try:
+            sel.add(name)
+        except RuntimeError:
+            indices.append(None)
+            continue
+
+        # The name is already in the list or matches multiple objects, it
+        # needs to be encoded alone.
+        if sel.length() != length + 1:
+            indices.append(-1)
+        else:
+            indices.append(length)
+
+    encoded = []
+    for name, index in zip(names, indices):
+        if index is None:
+            encoded.append(name)
+        elif index == -1:
+            encoded.append(encode(name, default=name))
+        elif "." in name:
+            try:
+                encoded.append(Plug(sel.getPlug(index)))
+            except (RuntimeError, TypeError):
+                encoded.append(name)
+        else:
+            encoded.append(_encode_mobject(sel.getDependNode(index)))
+    return encoded
+
+
 # MIT License
 
 # Copyright (c) 2022 Fabien Taxil
@@ -0,0 +1,64 @@
+"""Test for action."""
+import pytest
+
+import ftd.action
+
+
+def _decorator(func):
+    """Decorate a function to tag its result."""
+
+    def wrapper():
+        return ("decorated", func())
+
+    return wrapper
+
+
+def test_build_callable_cache():
+    """Test that the callables are only built again when the code changes."""
+    action = ftd.action.Action("test")
+    action.code = "return 1\n"
+    cmd = action.build_callable()
+    assert action.build_callable() is cmd
+    assert cmd() == 1
+
+    action.code = "return 2\n"
+    other = action.build_callable()
+    assert other is not cmd
+    assert other() == 2
+
+
+def test_build_callable_globals():
+    """Test that the module level names are available to the actions."""
+    action = ftd.action.Action("test")
+    action.code = "return ACTIONS\n"
+    assert action.execute() is ftd.action.ACTIONS
+
+
+def test_build_callable_decorators(monkeypatch):
+    """Test that the decorators are applied and part of the cache key."""
+    monkeypatch.setitem(ftd.action.DECORATORS, "tag", _decorator)
+    action = ftd.action.Action("test")
+    action.code = "return 1\n"
+    action.decorators = ["tag"]
+    cmd = action.build_callable()
+    assert cmd() == ("decorated", 1)
+    assert action.build_callable() is cmd
+
+    monkeypatch.setitem(ftd.action.DECORATORS, "tag", lambda x: x)
+    assert action.build_callable() is not cmd
+    assert action.execute() == 1
+
+
+def test_get_variant_data():
+    """Test to get the variants after they are assigned again."""
+    action = ftd.action.Action.from_dict(
+        "test", {"variants": [{"name": "a", "code": "return 1\n"}]}
+    )
+    assert action.get_variant_data("a")["code"] == "return 1\n"
+    assert action.execute("a") == 1
+
+    action.variants = [{"name": "b", "code": "return 2\n"}]
+    assert action.get_variant_data("b")["code"] == "return 2\n"
+    assert action.execute("b") == 2
+    with pytest.raises(NameError):
+        action.get_variant_data("a")
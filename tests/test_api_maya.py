@@ -0,0 +1,139 @@
+# pylint: disable=protected-access
+"""Test for the maya api."""
+import pytest
+
+from maya import cmds
+
+from ftd.api import maya
+
+
+@pytest.fixture
+def scene():
+    """Create a scene with duplicated short names and an instanced shape."""
+    cmds.polyCube(name="A")
+    cmds.group("A", name="B")
+    cmds.duplicate("B", name="C")
+    cmds.instance("|B|A", name="D")
+    cmds.createNode("transform", name="E")
+
+
+@pytest.mark.usefixtures("scene")
+@pytest.mark.parametrize(
+    "args",
+    [
+        (),
+        ("E",),
+        ("B", "E"),
+        ("E", "B"),
+        ("missing",),
+        ("E", "missing", "B"),
+        ("A",),
+        ("|B|A", "|C|A"),
+        ("AShape",),
+        ("A*",),
+        ("*Shape",),
+        ("E", "E"),
+        ("E", "|E"),
+        ("B", "B*"),
+    ],
+    ids=[
+        "all",
+        "name",
+        "names",
+        "order",
+        "missing",
+        "missing_between",
+        "duplicated_short_name",
+        "paths",
+        "instanced_shape",
+        "wildcard",
+        "wildcard_shapes",
+        "duplicated_names",
+        "same_node",
+        "overlapping_patterns",
+    ],
+)
+def test_ls(args):
+    """Test that ls returns the same nodes as the command."""
+    expected = [maya.encode(x) for x in cmds.ls(*args)]
+    assert maya.ls(*args) == expected
+
+
+def test_encode_cache_rename():
+    """Test that a renamed node is not found with its previous name."""
+    node = maya.encode(cmds.createNode("transform", name="A"))
+    assert maya.encode("A") is node
+    cmds.rename("A", "B")
+    assert maya.encode("A", default=None) is None
+    assert maya.encode("B") is node
+
+
+def test_encode_cache_delete():
+    """Test that a deleted node is found again once the deletion is undone."""
+    cmds.undoInfo(state=True)
+    node = maya.encode(cmds.createNode("transform", name="A"))
+    assert maya.encode("A") is node
+    cmds.delete("A")
+    assert maya.encode("A", default=None) is None
+    cmds.undo()
+    assert maya.encode("A") == node
+
+
+def test_encode_cache_replaced():
+    """Test that a node deleted and replaced is not returned."""
+    node = maya.encode(cmds.createNode("transform", name="A"))
+    assert maya.encode("A") is node
+    cmds.delete("A")
+    other = maya.encode(cmds.createNode("transform", name="A"))
+    assert maya.encode("A") is other
+    assert other != node
+
+
+def test_encode_cache_duplicated_names():
+    """Test the cached paths once the short name is not unique anymore."""
+    cmds.createNode("transform", name="B")
+    node = maya.encode(cmds.createNode("transform", name="A", parent="B"))
+    assert maya.encode("A") is node
+    assert maya.encode("B|A") is node
+    assert maya.encode("|B|A") is node
+
+    cmds.createNode("transform", name="C")
+    other = maya.encode(cmds.createNode("transform", name="A", parent="C"))
+    assert maya.encode("|B|A") is node
+    assert maya.encode("|C|A") is other
+
+    # The cached names give the same result than a lookup in the scene.
+    for name in ("A", "B|A"):
+        cached = maya.encode(name, default=None)
+        maya._NAME_CACHE.clear()
+        assert maya.encode(name, default=None) == cached
+
+
+def test_encode_component():
+    """Test to encode the name of a component."""
+    cmds.polyCube(name="A")
+    with pytest.raises(ValueError):
+        maya.encode("A.vtx[0]")
+    assert maya.encode("A.vtx[0]", default=None) is None
+
+
+@pytest.mark.parametrize(
+    "func",
+    [lambda: "A.vtx[0]", lambda: ["A.vtx[0]"]],
+    ids=["string", "list"],
+)
+def test_wrap_component(func):
+    """Test that the components returned by a command are not encoded."""
+    cmds.polyCube(name="A")
+    returned = maya._wrap(func)
+    assert returned in ("A.vtx[0]", ["A.vtx[0]"])
+
+
+def test_wrap_decode():
+    """Test that only the encoded arguments are decoded."""
+    node = maya.encode(cmds.createNode("transform", name="A"))
+    obj = object()
+    received = []
+    maya._wrap(lambda *args: received.extend(args), node, obj)
+    assert received == ["A", obj]
+    assert type(received[0]) is str  # pylint: disable=unidiomatic-typecheck